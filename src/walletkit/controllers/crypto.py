@@ -10,6 +10,7 @@ from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 from walletkit.constants.crypto import CRYPTO_CLIENT_SEED, CRYPTO_CONTEXT, CRYPTO_JWT_TTL
 from walletkit.controllers.keychain import KeyChain
 from walletkit.types.logger import Logger
+from walletkit.utils.jsonrpc import decode_message, encode_message
 from walletkit.utils.storage import IKeyValueStorage
 from walletkit.utils.crypto_utils import (
     BASE64,
@@ -22,6 +23,7 @@ from walletkit.utils.crypto_utils import (
     encode_type_two_envelope,
     decode_type_two_envelope,
     encrypt_message,
+    forget_sym_key,
     generate_key_pair,
     generate_random_bytes32,
     get_payload_sender_public_key,
@@ -168,6 +170,8 @@ class Crypto:
         """
         self._check_initialized()
         topic = override_topic or hash_key(sym_key)
+        if self.keychain.has(topic):
+            forget_sym_key(self.keychain.get(topic))
         await self.keychain.set(topic, sym_key)
         return topic
 
@@ -187,6 +191,8 @@ class Crypto:
             topic: Topic
         """
         self._check_initialized()
+        if self.keychain.has(topic):
+            forget_sym_key(self.keychain.get(topic))
         await self.keychain.delete(topic)
 
     async def encode(
@@ -209,7 +215,7 @@ class Crypto:
         if opts is None:
             opts = {}
         
-        message = json.dumps(payload)
+        message = encode_message(payload)
         # WalletConnect sign-client uses base64 (padded) for relay payloads by default.
         # base64url is primarily used for deeplinks / URI contexts.
         encoding = opts.get("encoding", BASE64)
@@ -271,7 +277,7 @@ class Crypto:
         # Type 2 envelope (unencrypted)
         if payload_type == TYPE_2:
             message = decode_type_two_envelope(encoded, encoding)
-            return json.loads(message)
+            return decode_message(message)
         
         # Type 1 envelope (needs public keys)
         if payload_type == TYPE_1:
@@ -287,7 +293,7 @@ class Crypto:
         try:
             sym_key = self._get_sym_key(topic)
             message = decrypt_message(sym_key, encoded, encoding)
-            return json.loads(message)
+            return decode_message(message)
         except (ValueError, KeyError) as e:
             # Invalid key or decryption failure
             client_id = await self.get_client_id()
@@ -12,7 +12,12 @@ from walletkit.exceptions import ConnectionError, ProtocolError, TimeoutError
 from walletkit.types.core import ICore
 from walletkit.types.logger import Logger
 from walletkit.utils.events import EventEmitter
-from walletkit.utils.jsonrpc import format_jsonrpc_request, get_big_int_rpc_id
+from walletkit.utils.jsonrpc import (
+    decode_message,
+    encode_message,
+    format_jsonrpc_request,
+    get_big_int_rpc_id,
+)
 
 
 class Relayer:
@@ -378,7 +383,8 @@ class Relayer:
             return
         
         try:
-            message = json.dumps(payload)
+            # Text frame: the relay expects JSON as a str
+            message = encode_message(payload).decode("utf-8")
             # Add timeout to send operation
             await asyncio.wait_for(
                 self._websocket.send(message),
@@ -409,7 +415,7 @@ class Relayer:
                 try:
                     # Any inbound frame indicates the connection is alive
                     self._last_heartbeat = asyncio.get_event_loop().time()
-                    payload = json.loads(message)
+                    payload = decode_message(message)
                     await self._handle_message(payload)
                 except json.JSONDecodeError as e:
                     self.logger.error(f"Failed to parse message: {e}")
@@ -2,6 +2,8 @@
 from walletkit.utils.events import EventEmitter
 from walletkit.utils.jsonrpc import (
     JsonRpcError,
+    decode_message,
+    encode_message,
     format_jsonrpc_error,
     format_jsonrpc_request,
     format_jsonrpc_result,
@@ -20,6 +22,8 @@ __all__ = [
     "FileStorage",
     "MemoryStorage",
     "JsonRpcError",
+    "encode_message",
+    "decode_message",
     "format_jsonrpc_request",
     "format_jsonrpc_result",
     "format_jsonrpc_error",
@@ -1,7 +1,8 @@
 """Crypto utility functions."""
 import base64
+import hashlib
 import secrets
-from typing import Optional
+from typing import Optional, Union
 
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey, X25519PublicKey
@@ -18,6 +19,12 @@ BASE16 = "base16"
 BASE64 = "base64"
 BASE64URL = "base64url"
 
+# ChaCha20Poly1305 objects by symmetric key (hex). Building one costs about
+# as much as sealing a small message, and a topic reuses its key for every
+# message. Bounded LRU, and cleared per key by forget_sym_key().
+_CIPHER_CACHE_SIZE = 64
+_cipher_cache: dict[str, ChaCha20Poly1305] = {}
+
 
 def bytes_to_hex(data: bytes) -> str:
     """Convert bytes to hex string."""
@@ -29,6 +36,35 @@ def hex_to_bytes(hex_str: str) -> bytes:
     return bytes.fromhex(hex_str)
 
 
+def _get_cipher(sym_key: str) -> ChaCha20Poly1305:
+    """Get the (cached) AEAD cipher for a symmetric key.
+    
+    Args:
+        sym_key: Symmetric key (hex)
+        
+    Returns:
+        ChaCha20-Poly1305 cipher
+    """
+    # Re-inserting on every lookup keeps the dict in least-recently-used order
+    cipher = _cipher_cache.pop(sym_key, None)
+    if cipher is None:
+        cipher = ChaCha20Poly1305(hex_to_bytes(sym_key))
+        if len(_cipher_cache) >= _CIPHER_CACHE_SIZE:
+            # Evict the least recently used entry (dicts keep insertion order)
+            del _cipher_cache[next(iter(_cipher_cache))]
+    _cipher_cache[sym_key] = cipher
+    return cipher
+
+
+def forget_sym_key(sym_key: str) -> None:
+    """Drop the cached cipher for a symmetric key that is no longer used.
+    
+    Args:
+        sym_key: Symmetric key (hex)
+    """
+    _cipher_cache.pop(sym_key, None)
+
+
 def generate_key_pair() -> dict[str, str]:
     """Generate X25519 key pair.
     
@@ -90,27 +126,23 @@ def hash_key(key: str) -> str:
     Returns:
         Hashed key (hex)
     """
-    key_bytes = hex_to_bytes(key)
-    digest = hashes.Hash(hashes.SHA256())
-    digest.update(key_bytes)
-    hashed = digest.finalize()
-    return bytes_to_hex(hashed)
+    # hashlib is OpenSSL-backed like cryptography's hashes.Hash, without
+    # the per-call object setup
+    return hashlib.sha256(hex_to_bytes(key)).hexdigest()
 
 
-def hash_message(message: str) -> str:
+def hash_message(message: Union[str, bytes]) -> str:
     """Hash a message using SHA-256.
     
     Args:
-        message: Message to hash (UTF-8 string)
+        message: Message to hash (UTF-8 string or bytes)
         
     Returns:
         Hashed message (hex)
     """
-    message_bytes = message.encode("utf-8")
-    digest = hashes.Hash(hashes.SHA256())
-    digest.update(message_bytes)
-    hashed = digest.finalize()
-    return bytes_to_hex(hashed)
+    if isinstance(message, str):
+        message = message.encode("utf-8")
+    return hashlib.sha256(message).hexdigest()
 
 
 def encode_type_byte(type_val: int) -> bytes:
@@ -144,13 +176,12 @@ def decode_type_byte(byte_data: bytes) -> int:
     if len(byte_data) == 1:
         return byte_data[0]
     # Fallback: some older code encoded ascii digits; keep a safe fallback.
-    try:
-        s = byte_data.decode("utf-8")
-        if s.isdigit():
-            return int(s)
-    except (UnicodeDecodeError, ValueError):
-        # Invalid UTF-8 or not a digit - fall through to raise
-        pass
+    # bytes.isdigit() only accepts ASCII digits, so int() cannot fail here;
+    # at most three digits, and the value must fit a byte like encode_type_byte.
+    if len(byte_data) <= 3 and byte_data.isdigit():
+        type_val = int(byte_data)
+        if type_val <= 255:
+            return type_val
     raise ValueError("Invalid type byte")
 
 
@@ -197,18 +228,19 @@ def serialize_envelope(
     Returns:
         Base64 encoded envelope
     """
-    if decode_type_byte(type_byte) == TYPE_2:
-        return base64.b64encode(type_byte + sealed).decode("utf-8")
+    type_val = decode_type_byte(type_byte)
+    if type_val == TYPE_2:
+        return base64.b64encode(b"".join((type_byte, sealed))).decode("ascii")
     
-    if decode_type_byte(type_byte) == TYPE_1:
+    if type_val == TYPE_1:
         if sender_public_key is None:
             raise ValueError("Missing sender public key for type 1 envelope")
         return base64.b64encode(
-            type_byte + sender_public_key + iv + sealed
-        ).decode("utf-8")
+            b"".join((type_byte, sender_public_key, iv, sealed))
+        ).decode("ascii")
     
     # TYPE_0 (default)
-    return base64.b64encode(type_byte + iv + sealed).decode("utf-8")
+    return base64.b64encode(b"".join((type_byte, iv, sealed))).decode("ascii")
 
 
 def deserialize_envelope(
@@ -269,7 +301,7 @@ def deserialize_envelope(
 
 def encrypt_message(
     sym_key: str,
-    message: str,
+    message: Union[str, bytes],
     type_val: int = TYPE_0,
     sender_public_key: Optional[str] = None,
     iv: Optional[str] = None,
@@ -279,7 +311,7 @@ def encrypt_message(
     
     Args:
         sym_key: Symmetric key (hex)
-        message: Message to encrypt (UTF-8 string)
+        message: Message to encrypt (string, or already UTF-8 encoded bytes)
         type_val: Envelope type
         sender_public_key: Optional sender public key (hex)
         iv: Optional IV (hex)
@@ -301,11 +333,10 @@ def encrypt_message(
     else:
         iv_bytes = hex_to_bytes(iv)
     
-    key_bytes = hex_to_bytes(sym_key)
-    message_bytes = message.encode("utf-8")
+    cipher = _get_cipher(sym_key)
+    message_bytes = message.encode("utf-8") if isinstance(message, str) else message
     
     # Encrypt with ChaCha20-Poly1305
-    cipher = ChaCha20Poly1305(key_bytes)
     sealed = cipher.encrypt(iv_bytes, message_bytes, None)
     
     result = serialize_envelope(type_byte, sealed, iv_bytes, sender_pub_key_bytes)
@@ -330,14 +361,13 @@ def decrypt_message(
     Returns:
         Decrypted message (UTF-8 string)
     """
-    key_bytes = hex_to_bytes(sym_key)
+    cipher = _get_cipher(sym_key)
     envelope = deserialize_envelope(encoded, encoding)
     
     sealed = envelope["sealed"]
     iv = envelope["iv"]
     
     # Decrypt with ChaCha20-Poly1305
-    cipher = ChaCha20Poly1305(key_bytes)
     try:
         message_bytes = cipher.decrypt(iv, sealed, None)
         return message_bytes.decode("utf-8")
@@ -347,21 +377,20 @@ def decrypt_message(
         raise ValueError("Failed to decrypt") from e
 
 
-def encode_type_two_envelope(message: str, encoding: str = BASE64) -> str:
+def encode_type_two_envelope(message: Union[str, bytes], encoding: str = BASE64) -> str:
     """Encode type 2 envelope (unencrypted).
     
     Args:
-        message: Message to encode
+        message: Message to encode (string or UTF-8 encoded bytes)
         encoding: Encoding type
         
     Returns:
         Encoded envelope
     """
     type_byte = encode_type_byte(TYPE_2)
-    sealed = message.encode("utf-8")
-    iv = secrets.token_bytes(IV_LENGTH)  # Not used but required for structure
-    
-    result = serialize_envelope(type_byte, sealed, iv)
+    sealed = message.encode("utf-8") if isinstance(message, str) else message
+    # Type 2 envelopes carry no IV, so don't spend entropy generating one
+    result = serialize_envelope(type_byte, sealed, b"")
     
     if encoding == BASE64URL:
         return to_base64url(result)
@@ -1,8 +1,22 @@
 """JSON-RPC utilities."""
+import json
+import math
 from typing import Any, Dict, Optional, Union
 
 from walletkit.exceptions import ProtocolError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# orjson only handles 64-bit integers: it refuses to encode larger ones and
+# silently decodes them as floats. Such integers have 19+ digits; mapping all
+# digits to "0" lets one substring search (in C) find any candidate run.
+# Long digit runs inside strings (zero-padded hex) just take the stdlib path.
+_DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+_LONG_DIGIT_RUN = b"0" * 19
+
 
 class JsonRpcError(ProtocolError):
     """JSON-RPC error."""
@@ -151,3 +165,78 @@ def get_big_int_rpc_id() -> int:
     # Generate a large random ID (similar to JS implementation)
     return int(time.time() * 1000000) + random.randint(0, 999999)
 
+
+def _has_non_finite(value: Any) -> bool:
+    """Check whether a value contains NaN or +/-Infinity floats.
+    
+    Args:
+        value: Value to inspect
+        
+    Returns:
+        True if a non-finite float is present
+    """
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(v) for v in value)
+    return False
+
+
+def encode_message(payload: Any) -> bytes:
+    """Serialize a JSON-RPC payload (or any JSON value) to JSON bytes.
+    
+    Uses orjson when available and falls back to stdlib json for values
+    orjson would reject or alter (integers beyond 64 bits, NaN/Infinity),
+    so the decoded result doesn't depend on whether orjson is installed.
+    
+    Args:
+        payload: Value to serialize
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        try:
+            # Match stdlib json, which coerces non-string dict keys to strings
+            data = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            # orjson writes NaN/Infinity as null; only inspect when a null appears
+            if b"null" not in data or not _has_non_finite(payload):
+                return data
+    # Compact separators and raw UTF-8, like orjson, so output bytes match
+    try:
+        return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    except UnicodeEncodeError:
+        # Lone surrogates have no UTF-8 form; keep them as \uXXXX escapes
+        return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def decode_message(message: Union[str, bytes]) -> Any:
+    """Deserialize a JSON-RPC payload (or any JSON value).
+    
+    Uses orjson when available and falls back to stdlib json for documents
+    orjson would reject or alter (integers beyond 64 bits, NaN/Infinity).
+    
+    Args:
+        message: JSON text or UTF-8 encoded JSON
+        
+    Returns:
+        Deserialized value
+        
+    Raises:
+        json.JSONDecodeError: If message is not valid JSON
+    """
+    if orjson is not None:
+        # surrogatepass: orjson rejects the result and stdlib json takes over
+        data = message.encode("utf-8", "surrogatepass") if isinstance(message, str) else message
+        if _LONG_DIGIT_RUN not in data.translate(_DIGITS_TO_ZERO):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # Possibly NaN/Infinity, which only stdlib json accepts
+                pass
+    return json.loads(message)
@@ -1,10 +1,12 @@
 """Storage abstraction layer."""
 import json
+import os
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Optional
 
 from walletkit.exceptions import StorageError
+from walletkit.utils.jsonrpc import decode_message, encode_message
 
 
 class IKeyValueStorage(ABC):
@@ -65,6 +67,8 @@ class FileStorage(IKeyValueStorage):
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
         self._cache: dict[str, Any] = {}
+        # Raw file contents read at startup, decoded on first get_item
+        self._raw: dict[str, bytes] = {}
         self._load_cache()
 
     def _get_file_path(self, key: str) -> Path:
@@ -80,17 +84,33 @@ class FileStorage(IKeyValueStorage):
         safe_key = key.replace("/", "_").replace("\\", "_")
         return self.storage_path / f"{safe_key}.json"
 
+    def _scan_files(self) -> list[tuple[str, str]]:
+        """List storage files without building a Path per entry.
+        
+        Returns:
+            (key, file path) pairs for every .json file in the directory
+        """
+        try:
+            with os.scandir(self.storage_path) as entries:
+                return [
+                    (entry.name[:-5].replace("_", "/"), entry.path)
+                    for entry in entries
+                    if entry.name.endswith(".json")
+                ]
+        except OSError:
+            # Unreadable directory - treat as empty, like Path.glob did
+            return []
+
     def _load_cache(self) -> None:
-        """Load all files into cache."""
+        """Read all files into the raw (undecoded) cache."""
         if not self.storage_path.exists():
             return
 
-        for file_path in self.storage_path.glob("*.json"):
+        for key, file_path in self._scan_files():
             try:
-                key = file_path.stem.replace("_", "/")
-                with open(file_path, "r") as f:
-                    self._cache[key] = json.load(f)
-            except (FileNotFoundError, PermissionError, json.JSONDecodeError) as e:
+                with open(file_path, "rb") as f:
+                    self._raw[key] = f.read()
+            except (FileNotFoundError, PermissionError) as e:
                 # Log but don't fail initialization if individual files are corrupted
                 # This allows the cache to load other valid files
                 pass
@@ -103,15 +123,25 @@ class FileStorage(IKeyValueStorage):
         if key in self._cache:
             return self._cache[key]
 
+        raw = self._raw.get(key)
+        if raw is not None:
+            try:
+                value = decode_message(raw)
+            except json.JSONDecodeError as e:
+                raise StorageError(f"Corrupted storage file for key '{key}': {e}") from e
+            del self._raw[key]
+            self._cache[key] = value
+            return value
+
         file_path = self._get_file_path(key)
         if not file_path.exists():
             return None
 
         try:
-            with open(file_path, "r") as f:
-                value = json.load(f)
-                self._cache[key] = value
-                return value
+            with open(file_path, "rb") as f:
+                value = decode_message(f.read())
+            self._cache[key] = value
+            return value
         except FileNotFoundError:
             return None
         except (PermissionError, OSError) as e:
@@ -121,20 +151,31 @@ class FileStorage(IKeyValueStorage):
 
     async def set_item(self, key: str, value: Any) -> None:
         """Set an item in storage."""
+        data = encode_message(value)
+        self._raw.pop(key, None)
         self._cache[key] = value
         file_path = self._get_file_path(key)
+        # Write next to the target and swap it in, so a crash mid-write
+        # never leaves a truncated file behind
+        tmp_path = file_path.with_name(f"{file_path.name}.tmp")
 
         try:
-            with open(file_path, "w") as f:
-                json.dump(value, f)
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, file_path)
         except (PermissionError, OSError) as e:
             # Remove from cache if write failed
             self._cache.pop(key, None)
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
             raise StorageError(f"Failed to write storage file for key '{key}': {e}") from e
 
     async def remove_item(self, key: str) -> None:
         """Remove an item from storage."""
         self._cache.pop(key, None)
+        self._raw.pop(key, None)
         file_path = self._get_file_path(key)
 
         if file_path.exists():
@@ -147,14 +188,9 @@ class FileStorage(IKeyValueStorage):
 
     async def get_keys(self) -> list[str]:
         """Get all storage keys."""
-        keys = set(self._cache.keys())
-
-        if self.storage_path.exists():
-            for file_path in self.storage_path.glob("*.json"):
-                key = file_path.stem.replace("_", "/")
-                keys.add(key)
-
-        return list(keys)
+        # Every file is read into _raw at startup and every write goes
+        # through set_item, so no directory scan is needed here
+        return [*self._cache, *self._raw]
 
 
 class MemoryStorage(IKeyValueStorage):
@@ -1,7 +1,60 @@
 """URI parsing and formatting utilities."""
 import base64
+import re
 from typing import Any, Dict, List, Optional
-from urllib.parse import parse_qs, urlencode, urlparse
+from urllib.parse import quote_plus, unquote_plus
+
+# [wc:[//]]topic@version[?query] - the path (up to the first "?") must hold
+# exactly one "@", otherwise the URI has no usable version.
+_URI_RE = re.compile(
+    r"(?:wc:(?://)?)?(?P<topic>[^@?]*)@(?P<version>[^@?]*)(?:\?(?P<query>.*))?",
+    re.DOTALL,
+)
+# Only strings made of base64 characters (whitespace allowed, as
+# b64decode ignores it) are worth trying to decode
+_BASE64_RE = re.compile(r"[A-Za-z0-9+/=\s]+")
+# Characters quote_plus() leaves untouched; topics, keys and timestamps
+# normally consist of these only, so they can skip quoting
+_QUERY_SAFE_RE = re.compile(r"[A-Za-z0-9_.~-]*")
+
+
+def _quote_query_value(value: Any) -> str:
+    """Quote a query key or value the way urlencode() does.
+    
+    Args:
+        value: Key or value to quote
+        
+    Returns:
+        URL-encoded string
+    """
+    if isinstance(value, str) and _QUERY_SAFE_RE.fullmatch(value):
+        return value
+    return quote_plus(value if isinstance(value, bytes) else str(value))
+
+
+def _parse_query(query: str) -> Dict[str, str]:
+    """Parse a URI query string like parse_qsl, keeping the first value per key.
+    
+    Pairs without "=" or with an empty value are skipped, and "+"/"%XX"
+    escapes are only decoded when present.
+    
+    Args:
+        query: Query string (without the leading "?")
+        
+    Returns:
+        Query parameters
+    """
+    params: Dict[str, str] = {}
+    for pair in query.split("&"):
+        key, sep, value = pair.partition("=")
+        if not value:
+            continue
+        if "%" in pair or "+" in pair:
+            key = unquote_plus(key)
+            value = unquote_plus(value)
+        if key not in params:
+            params[key] = value
+    return params
 
 
 def parse_relay_params(params: Dict[str, Any], delimiter: str = "-") -> Dict[str, Any]:
@@ -14,15 +67,9 @@ def parse_relay_params(params: Dict[str, Any], delimiter: str = "-") -> Dict[str
     Returns:
         Relay parameters
     """
-    relay: Dict[str, Any] = {}
     prefix = f"relay{delimiter}"
-    
-    for key, value in params.items():
-        if key.startswith(prefix):
-            name = key.replace(prefix, "")
-            relay[name] = value
-    
-    return relay
+    size = len(prefix)
+    return {key[size:]: value for key, value in params.items() if key.startswith(prefix)}
 
 
 def parse_topic(topic: str) -> str:
@@ -49,7 +96,7 @@ def parse_uri(uri: str) -> Dict[str, Any]:
         Parsed URI parameters
     """
     # Handle base64 encoded URIs
-    if "wc:" not in uri:
+    if "wc:" not in uri and _BASE64_RE.fullmatch(uri):
         try:
             decoded = base64.b64decode(uri).decode("utf-8")
             if "wc:" in decoded:
@@ -58,38 +105,16 @@ def parse_uri(uri: str) -> Dict[str, Any]:
             # Not base64 encoded or invalid encoding - continue with original URI
             pass
     
-    # Extract protocol
-    protocol = "wc"
-    if uri.startswith("wc://"):
-        uri = uri[5:]  # Remove "wc://"
-        protocol = "wc"
-    elif uri.startswith("wc:"):
-        uri = uri[3:]  # Remove "wc:"
-        protocol = "wc"
-    
-    # Parse path (topic@version)
-    path_end = uri.index("?") if "?" in uri else len(uri)
-    path = uri[:path_end]
-    
-    # Split topic@version
-    if "@" not in path:
+    # Strip the protocol and split topic@version?query in one pass
+    match = _URI_RE.fullmatch(uri)
+    if match is None:
         raise ValueError("Invalid URI format: missing version")
     
-    required_values = path.split("@")
-    if len(required_values) != 2:
-        raise ValueError("Invalid URI format: missing version")
-    
-    topic = parse_topic(required_values[0])
-    version = int(required_values[1])
-    
-    # Parse query string
-    query_string = uri[path_end + 1 :] if path_end else ""
-    query_params = parse_qs(query_string)
+    topic = parse_topic(match.group("topic"))
+    version = int(match.group("version"))
     
-    # Convert to simple dict (parse_qs returns lists)
-    params: Dict[str, Any] = {}
-    for key, value_list in query_params.items():
-        params[key] = value_list[0] if value_list else None
+    # Parse query string (blank values are dropped, first value wins)
+    params: Dict[str, Any] = _parse_query(match.group("query") or "")
     
     # Parse methods
     methods: Optional[List[str]] = None
@@ -102,7 +127,8 @@ def parse_uri(uri: str) -> Dict[str, Any]:
         expiry_timestamp = int(params["expiryTimestamp"])
     
     return {
-        "protocol": protocol,
+        # The pattern only accepts the "wc" protocol (or none)
+        "protocol": "wc",
         "topic": topic,
         "version": version,
         "symKey": params.get("symKey"),
@@ -166,8 +192,10 @@ def format_uri(params: Dict[str, Any]) -> str:
         all_params["methods"] = ",".join(params["methods"])
     
     # Sort and build query string
-    sorted_params = sorted(all_params.items())
-    query_string = urlencode(sorted_params)
+    query_string = "&".join(
+        f"{_quote_query_value(key)}={_quote_query_value(value)}"
+        for key, value in sorted(all_params.items())
+    )
     
     protocol = params.get("protocol", "wc")
     topic = params["topic"]
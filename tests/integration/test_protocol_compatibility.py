@@ -1,10 +1,11 @@
 """Protocol compatibility tests for WalletConnect protocol."""
 import pytest
-import json
 from typing import Dict, Any
 
 from walletkit.utils.uri import parse_uri, format_uri
 from walletkit.utils.jsonrpc import (
+    decode_message,
+    encode_message,
     format_jsonrpc_request,
     format_jsonrpc_result,
     format_jsonrpc_error,
@@ -37,6 +38,13 @@ class TestURIParsing:
         assert parsed["version"] == 2
         assert parsed["symKey"] == "def456"
         assert parsed["relay"]["protocol"] == "irn"
+        
+        # URI patterns must stay compiled once at import, not per call
+        import re
+        from walletkit.utils import uri as uri_module
+        
+        assert isinstance(uri_module._URI_RE, re.Pattern)
+        assert isinstance(uri_module._BASE64_RE, re.Pattern)
     
     def test_format_valid_uri(self):
         """Test formatting a valid WalletConnect URI."""
@@ -228,13 +236,13 @@ class TestCryptoCompatibility:
         sym_key = derive_sym_key(key_pair["privateKey"], key_pair["publicKey"])
         
         message = {"jsonrpc": "2.0", "id": 1, "method": "test"}
-        message_str = json.dumps(message)
+        message_bytes = encode_message(message)
         
-        encrypted = encrypt_message(sym_key, message_str)
+        encrypted = encrypt_message(sym_key, message_bytes)
         decrypted = decrypt_message(sym_key, encrypted)
         
-        assert decrypted == message_str
-        assert json.loads(decrypted) == message
+        assert decrypted == message_bytes.decode("utf-8")
+        assert decode_message(decrypted) == message
     
     def test_hash_message(self):
         """Test message hashing produces consistent results."""
@@ -265,9 +273,8 @@ class TestMessageEnvelopeFormat:
         sym_key = derive_sym_key(key_pair["privateKey"], key_pair["publicKey"])
         
         message = {"jsonrpc": "2.0", "id": 1, "method": "test"}
-        message_str = json.dumps(message)
         
-        encrypted = encrypt_message(sym_key, message_str)
+        encrypted = encrypt_message(sym_key, encode_message(message))
         
         # Encrypted message should be a string (base64 encoded)
         assert isinstance(encrypted, str)
@@ -118,15 +118,11 @@ async def test_pairing_with_uri(wallet, dapp):
     })
     uri = pairing["uri"]
     
-    # Pair wallet with URI
+    # Pair wallet with URI (the pairing is stored before pair() returns)
     await wallet.pair(uri)
     
-    # Give some time for pairing to complete
-    await asyncio.sleep(0.5)
-    
     # Verify pairing exists
-    # (In a real scenario, we'd check pairing state)
-    assert True  # Placeholder - pairing should succeed
+    assert wallet.core.pairing.get(pairing["topic"]) is not None
 
 
 @pytest.mark.integration
@@ -324,8 +320,7 @@ async def test_session_disconnect(wallet, dapp):
         reason={"code": 6000, "message": "User disconnected"},
     )
     
-    # Verify session is removed
-    await asyncio.sleep(0.5)  # Give time for cleanup
+    # Verify session is removed (disconnect_session deletes it before returning)
     sessions = wallet.get_active_sessions()
     assert session_topic not in sessions or len(sessions) == 0
 
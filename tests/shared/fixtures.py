@@ -4,6 +4,7 @@ from typing import Any
 import pytest
 
 from walletkit.core import Core
+from walletkit.utils import jsonrpc as jsonrpc_module
 from walletkit.utils.storage import MemoryStorage
 
 
@@ -45,3 +46,13 @@ async def core(storage):
     core_instance = Core(storage=storage)
     await core_instance.start()
     return core_instance
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run a test with and without orjson installed."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(jsonrpc_module, "orjson", None)
+    elif jsonrpc_module.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
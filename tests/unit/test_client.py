@@ -1,6 +1,6 @@
 """Tests for WalletKit client."""
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 from walletkit.client import WalletKit
 from walletkit.core import Core
@@ -75,7 +75,7 @@ async def test_client_pair(client):
 @pytest.mark.asyncio
 async def test_client_events(client):
     """Test event handling."""
-    listener = MagicMock()
+    listener = Mock()
     
     client.on("session_proposal", listener)
     client.off("session_proposal", listener)
@@ -146,6 +146,26 @@ async def test_crypto_delete_sym_key(crypto):
     assert crypto.has_keys(topic) is False
 
 
+@pytest.mark.asyncio
+async def test_crypto_delete_sym_key_drops_cached_cipher(crypto, monkeypatch):
+    """Test that deleting or replacing a symmetric key evicts its cipher."""
+    from walletkit.utils import crypto_utils
+    
+    monkeypatch.setattr(crypto_utils, "_cipher_cache", {})
+    sym_key = "b" * 64
+    topic = await crypto.set_sym_key(sym_key)
+    await crypto.encode(topic, {"id": 1})
+    assert sym_key in crypto_utils._cipher_cache
+    
+    await crypto.delete_sym_key(topic)
+    assert sym_key not in crypto_utils._cipher_cache
+    
+    topic = await crypto.set_sym_key(sym_key, override_topic="topic")
+    await crypto.encode(topic, {"id": 1})
+    await crypto.set_sym_key("c" * 64, override_topic="topic")
+    assert sym_key not in crypto_utils._cipher_cache
+
+
 @pytest.mark.asyncio
 async def test_crypto_encode_type2(crypto):
     """Test encode with TYPE_2 envelope."""
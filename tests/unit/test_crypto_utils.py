@@ -7,6 +7,7 @@ from walletkit.utils.crypto_utils import (
     TYPE_0,
     TYPE_1,
     encode_type_byte,
+    encode_type_two_envelope,
     decrypt_message,
     derive_sym_key,
     encrypt_message,
@@ -71,6 +72,18 @@ def test_encode_type_byte_is_single_raw_byte():
     assert encode_type_byte(2) == b"\x02"
 
 
+def test_decode_type_byte_ascii_digit_fallback():
+    """Legacy ASCII-digit type bytes still decode; anything else is rejected."""
+    from walletkit.utils.crypto_utils import decode_type_byte
+
+    assert decode_type_byte(b"\x01") == 1
+    assert decode_type_byte(b"12") == 12
+    assert decode_type_byte(b"255") == 255
+    for invalid in (b"", b"ab", b"\xff\xfe", b"256", b"999999"):
+        with pytest.raises(ValueError):
+            decode_type_byte(invalid)
+
+
 def test_envelope_type_byte_roundtrip_base64():
     """Ensure base64 envelope decodes to the correct raw type byte at position 0."""
     sym_key = generate_random_bytes32()
@@ -86,6 +99,54 @@ def test_envelope_type_byte_roundtrip_base64():
     assert raw1[0] == 1
 
 
+def test_encrypt_message_accepts_bytes():
+    """Test that pre-encoded UTF-8 messages encrypt like strings."""
+    key = generate_random_bytes32()
+    iv = "00" * 12
+    
+    from_bytes = encrypt_message(key, "héllo".encode("utf-8"), iv=iv)
+    assert from_bytes == encrypt_message(key, "héllo", iv=iv)
+    assert decrypt_message(key, encrypt_message(key, b'{"a":1}')) == '{"a":1}'
+    assert encode_type_two_envelope(b"hi") == encode_type_two_envelope("hi")
+
+
+def test_cipher_cache_reuse_and_bound(monkeypatch):
+    """Test that ciphers are reused per key, LRU-bounded, and forgettable."""
+    from walletkit.utils import crypto_utils
+    
+    monkeypatch.setattr(crypto_utils, "_cipher_cache", {})
+    monkeypatch.setattr(crypto_utils, "_CIPHER_CACHE_SIZE", 2)
+    keys = [generate_random_bytes32() for _ in range(3)]
+    
+    encrypted = encrypt_message(keys[0], "hello")
+    cipher = crypto_utils._cipher_cache[keys[0]]
+    assert decrypt_message(keys[0], encrypted) == "hello"
+    assert crypto_utils._cipher_cache[keys[0]] is cipher
+    
+    encrypt_message(keys[1], "hello")
+    # Using keys[0] again makes keys[1] the least recently used entry
+    encrypt_message(keys[0], "hello")
+    encrypt_message(keys[2], "hello")
+    assert list(crypto_utils._cipher_cache) == [keys[0], keys[2]]
+    assert crypto_utils._cipher_cache[keys[0]] is cipher
+    
+    crypto_utils.forget_sym_key(keys[1])
+    crypto_utils.forget_sym_key(keys[0])
+    assert list(crypto_utils._cipher_cache) == keys[2:]
+
+
+def test_encrypt_message_type2_layout():
+    """A type 2 encrypt_message envelope is type byte + ciphertext, with no IV."""
+    from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
+
+    sym_key = generate_random_bytes32()
+    iv = "00" * 12
+    encrypted = encrypt_message(sym_key, "hi", type_val=2, iv=iv)
+
+    sealed = ChaCha20Poly1305(bytes.fromhex(sym_key)).encrypt(bytes.fromhex(iv), b"hi", None)
+    assert base64.b64decode(encrypted) == b"\x02" + sealed
+
+
 def test_encrypt_decrypt_type1():
     """Test type 1 envelope encryption."""
     key_pair_a = generate_key_pair()
@@ -37,6 +37,14 @@ def test_hash_message():
     assert hash1 != hash3
 
 
+def test_hash_message_known_vector_and_bytes():
+    """Test message hashing against a SHA-256 vector, for str and bytes."""
+    expected = "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+    
+    assert hash_message("abc") == expected
+    assert hash_message(b"abc") == expected
+
+
 def test_hash_key():
     """Test key hashing."""
     key = generate_random_bytes32()
@@ -3,6 +3,8 @@ import pytest
 
 from walletkit.utils.jsonrpc import (
     JsonRpcError,
+    decode_message,
+    encode_message,
     format_jsonrpc_error,
     format_jsonrpc_request,
     format_jsonrpc_result,
@@ -80,3 +82,48 @@ def test_is_jsonrpc_error():
     result = format_jsonrpc_result(123, "data")
     assert is_jsonrpc_error(result) is False
 
+
+def test_encode_decode_message_roundtrip(json_backend):
+    """Test that messages round-trip identically on both JSON backends."""
+    import json
+
+    request = format_jsonrpc_request(
+        "wc_sessionRequest", {"text": "héllo", "n": 1.5}, 1705592160123456
+    )
+
+    data = encode_message(request)
+    assert isinstance(data, bytes)
+    assert json.loads(data) == request
+    assert decode_message(data) == request
+    assert decode_message(data.decode("utf-8")) == request
+
+
+def test_encode_message_lone_surrogate(json_backend):
+    """Test that strings with no UTF-8 form are escaped instead of failing."""
+    payload = {"text": "\ud800"}
+
+    data = encode_message(payload)
+    assert data == b'{"text":"\\ud800"}'
+    assert decode_message(data) == payload
+
+
+def test_encode_decode_message_big_int_and_nan(json_backend):
+    """Test that values beyond orjson's range survive the round trip."""
+    import math
+
+    payload = {"value": 10**20, "max": 2**256 - 1, "nan": float("nan")}
+
+    decoded = decode_message(encode_message(payload))
+    assert decoded["value"] == 10**20
+    assert decoded["max"] == 2**256 - 1
+    assert math.isnan(decoded["nan"])
+
+    assert decode_message('{"value": 100000000000000000000}') == {"value": 10**20}
+
+
+def test_decode_message_invalid_json(json_backend):
+    """Test that invalid JSON raises json.JSONDecodeError."""
+    import json
+
+    with pytest.raises(json.JSONDecodeError):
+        decode_message("invalid json{")
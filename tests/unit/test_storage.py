@@ -206,3 +206,134 @@ async def test_file_storage_load_cache_nonexistent_dir():
         # Should handle gracefully
         storage = FileStorage(storage_path)
         assert storage.storage_path.exists()  # Should be created
+
+
+@pytest.mark.asyncio
+async def test_file_storage_json_bytes_match_across_backends(json_backend):
+    """FileStorage writes the same JSON bytes with or without orjson."""
+    import json
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = FileStorage(Path(tmpdir))
+
+        await storage.set_item("key1", {"unicode": "héllo", "ids": {1: "one"}})
+
+        raw = (Path(tmpdir) / "key1.json").read_bytes()
+        # Same bytes on both backends: compact separators, raw UTF-8
+        assert raw == '{"unicode":"héllo","ids":{"1":"one"}}'.encode("utf-8")
+        assert json.loads(raw) == {"unicode": "héllo", "ids": {"1": "one"}}
+
+        reloaded = FileStorage(Path(tmpdir))
+        assert await reloaded.get_item("key1") == {"unicode": "héllo", "ids": {"1": "one"}}
+
+
+@pytest.mark.asyncio
+async def test_file_storage_big_int_roundtrip(json_backend):
+    """Integers beyond 64 bits (e.g. wei amounts) are stored exactly."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = FileStorage(Path(tmpdir))
+
+        await storage.set_item("x", {"value": 10**20, "max": 2**256 - 1})
+
+        reloaded = FileStorage(Path(tmpdir))
+        value = await reloaded.get_item("x")
+        assert value == {"value": 10**20, "max": 2**256 - 1}
+        assert isinstance(value["value"], int)
+
+
+@pytest.mark.asyncio
+async def test_file_storage_reads_stdlib_big_int_and_nan(json_backend):
+    """Files written by stdlib json with big ints or NaN load unchanged."""
+    import json
+    import math
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        (Path(tmpdir) / "x.json").write_text(
+            json.dumps({"value": 100000000000000000000, "ratio": float("nan")})
+        )
+
+        storage = FileStorage(Path(tmpdir))
+        loaded = await storage.get_item("x")
+        storage._cache.clear()
+        from_disk = await storage.get_item("x")
+        for value in (loaded, from_disk):
+            assert value["value"] == 100000000000000000000
+            assert isinstance(value["value"], int)
+            assert math.isnan(value["ratio"])
+
+
+@pytest.mark.asyncio
+async def test_file_storage_non_finite_roundtrip(json_backend):
+    """NaN and Infinity are written the way stdlib json writes them."""
+    import math
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = FileStorage(Path(tmpdir))
+
+        await storage.set_item("x", [float("nan"), float("inf"), None])
+
+        reloaded = FileStorage(Path(tmpdir))
+        value = await reloaded.get_item("x")
+        assert math.isnan(value[0])
+        assert value[1] == float("inf")
+        assert value[2] is None
+
+
+@pytest.mark.asyncio
+async def test_file_storage_decodes_lazily():
+    """Files are read at startup but only decoded when first requested."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        (Path(tmpdir) / "good.json").write_text('{"a": 1}')
+        (Path(tmpdir) / "bad.json").write_text("invalid json{")
+
+        storage = FileStorage(Path(tmpdir))
+        assert storage._cache == {}
+        assert set(await storage.get_keys()) == {"good", "bad"}
+
+        assert await storage.get_item("good") == {"a": 1}
+        assert "good" not in storage._raw
+
+        from walletkit.exceptions import StorageError
+
+        with pytest.raises(StorageError, match="Corrupted storage file"):
+            await storage.get_item("bad")
+
+
+@pytest.mark.asyncio
+async def test_file_storage_get_keys_from_memory():
+    """get_keys is served from memory and keeps undecodable keys listed."""
+    from unittest.mock import patch
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        (Path(tmpdir) / "bad.json").write_text("invalid json{")
+        storage = FileStorage(Path(tmpdir))
+        await storage.set_item("key1", "value1")
+
+        from walletkit.exceptions import StorageError
+
+        with pytest.raises(StorageError):
+            await storage.get_item("bad")
+
+        with patch.object(FileStorage, "_scan_files", side_effect=AssertionError):
+            assert sorted(await storage.get_keys()) == ["bad", "key1"]
+
+            await storage.remove_item("key1")
+            assert await storage.get_keys() == ["bad"]
+
+
+@pytest.mark.asyncio
+async def test_file_storage_write_is_atomic():
+    """A failed write keeps the previous file and leaves no temp file."""
+    from unittest.mock import patch
+    from walletkit.exceptions import StorageError
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = FileStorage(Path(tmpdir))
+        await storage.set_item("key1", {"v": 1})
+
+        with patch("os.replace", side_effect=OSError("Replace error")):
+            with pytest.raises(StorageError, match="Failed to write"):
+                await storage.set_item("key1", {"v": 2})
+
+        assert sorted(p.name for p in Path(tmpdir).iterdir()) == ["key1.json"]
+        assert await FileStorage(Path(tmpdir)).get_item("key1") == {"v": 1}
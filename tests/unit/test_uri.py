@@ -90,6 +90,22 @@ def test_parse_uri_base64_encoded():
     assert parsed["version"] == 2
 
 
+def test_parse_uri_skips_base64_for_non_base64_input(monkeypatch):
+    """Test that input outside the base64 alphabet is not decoded."""
+    import walletkit.utils.uri as uri_module
+    
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("b64decode should not be called")
+    
+    monkeypatch.setattr(uri_module.base64, "b64decode", fail_decode)
+    
+    with pytest.raises(ValueError, match="Invalid URI format"):
+        parse_uri("not-a-uri!")
+    
+    parsed = parse_uri("//test_topic@2?symKey=test_key")
+    assert parsed["topic"] == "test_topic"
+
+
 def test_parse_uri_wc_protocol():
     """Test parsing URI with wc:// protocol."""
     from walletkit.utils.uri import parse_uri
@@ -127,6 +143,35 @@ def test_parse_uri_invalid_format():
         parse_uri("wc:test_topic@2@3")
 
 
+def test_parse_uri_at_sign_in_query():
+    """Test that only the path (before "?") must hold a single "@"."""
+    parsed = parse_uri("wc:test_topic@2?symKey=a@b&relay-protocol=irn")
+    assert parsed["topic"] == "test_topic"
+    assert parsed["version"] == 2
+    assert parsed["symKey"] == "a@b"
+    
+    with pytest.raises(ValueError, match="Invalid URI format"):
+        parse_uri("wc:test?topic@2")
+
+
+def test_parse_uri_blank_and_repeated_params():
+    """Test that blank query values are dropped and the first value wins."""
+    parsed = parse_uri("wc:test_topic@2?symKey=&relay-protocol=irn&relay-protocol=other")
+    assert parsed["symKey"] is None
+    assert parsed["relay"] == {"protocol": "irn"}
+    
+    parsed = parse_uri("wc:test_topic@2?symKey=&symKey=key")
+    assert parsed["symKey"] == "key"
+
+
+def test_parse_uri_decodes_query_escapes():
+    """Test that "+" and percent escapes are decoded like parse_qsl."""
+    parsed = parse_uri("wc:test_topic@2?symKey=a%2Bb+c&relay-data=x%3Dy&methods=m1%2Cm2")
+    assert parsed["symKey"] == "a+b c"
+    assert parsed["relay"] == {"data": "x=y"}
+    assert parsed["methods"] == ["m1", "m2"]
+
+
 def test_parse_relay_params():
     """Test parse_relay_params function."""
     from walletkit.utils.uri import parse_relay_params
@@ -143,6 +188,14 @@ def test_parse_relay_params():
     assert "other-param" not in relay
 
 
+def test_parse_relay_params_strips_prefix_only():
+    """Test that only the leading relay prefix is removed from keys."""
+    from walletkit.utils.uri import parse_relay_params
+    
+    relay = parse_relay_params({"relay-relay-url": "wss://x", "my-relay-data": "y"})
+    assert relay == {"relay-url": "wss://x"}
+
+
 def test_format_relay_params():
     """Test format_relay_params function."""
     from walletkit.utils.uri import format_relay_params
@@ -191,6 +244,30 @@ def test_format_uri_with_methods():
     assert "eth_sign" in uri
 
 
+def test_format_uri_query_matches_urlencode():
+    """Test that the query string is encoded exactly like urlencode()."""
+    from urllib.parse import urlencode
+    
+    params = {
+        "protocol": "wc",
+        "version": 2,
+        "topic": "test_topic",
+        "symKey": "key+/=",
+        "relay": {"protocol": "irn", "data": "a b&c"},
+        "methods": ["eth_sign", "personal_sign"],
+        "expiryTimestamp": 1234567890,
+    }
+    
+    expected = urlencode(sorted({
+        "relay-protocol": "irn",
+        "relay-data": "a b&c",
+        "symKey": "key+/=",
+        "methods": "eth_sign,personal_sign",
+        "expiryTimestamp": "1234567890",
+    }.items()))
+    assert format_uri(params) == f"wc:test_topic@2?{expected}"
+
+
 def test_parse_uri_with_methods():
     """Test parse_uri with methods."""
     params = {